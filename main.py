@@ -1,45 +1,74 @@
 from __future__ import annotations
 
 import os
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Tuple
 
-from typing import Iterable, List, Tuple
+from data_loader import iter_market_data
+from models import MarketDataPoint, Strategy, TickBuffer
 
-from data_loader import load_market_data
-from models import MarketDataPoint, Strategy
+
+def _run_batched(strategy: Strategy, ticks: TickBuffer) -> int:
+    """Vector path: one `generate_signals_batch` call over the whole buffer."""
+    sides = strategy.generate_signals_batch(ticks.price, ticks.sym, len(ticks.symbol_table))  # type: ignore[attr-defined]
+    return int((sides != 0).sum())
 
 
 def run_strategy(strategy: Strategy, ticks: Iterable[MarketDataPoint]) -> int:
-    """Run a strategy over ticks and return total number of emitted signals."""
+    """
+    Run a strategy over ticks and return total number of emitted signals.
+
+    A TickBuffer handed to a strategy whose batch path reproduces the
+    per-tick results exactly (`exact_batch`) is processed in one vectorized
+    call instead of tick by tick.
+    """
+    if isinstance(ticks, TickBuffer) and getattr(strategy, "exact_batch", False):
+        return _run_batched(strategy, ticks)
+
+    count = strategy.count_signals  # bind once, not per tick
     total_signals = 0
     for tick in ticks:
-        signals = strategy.generate_signals(tick)
-        total_signals += len(signals)
+        total_signals += count(tick)
     return total_signals
 
 
-def make_slices(ticks: List[MarketDataPoint], sizes: List[int]) -> List[Tuple[int, List[MarketDataPoint]]]:
-    """Return (n, ticks[:n]) pairs for each n in sizes."""
-    out: List[Tuple[int, List[MarketDataPoint]]] = []
+def load_slice(csv_path: str, n: int) -> List[MarketDataPoint]:
+    """Stream the first n ticks of the CSV."""
+    return list(islice(iter_market_data(csv_path), n))
+
+
+def make_slices(csv_path: str, sizes: List[int]) -> List[Tuple[int, List[MarketDataPoint]]]:
+    """Eager counterpart of `iter_slices`: (n, first n ticks) for each n in sizes."""
+    return [(n, load_slice(csv_path, n)) for n in sizes]
+
+
+def iter_slices(csv_path: str, sizes: List[int]) -> Iterator[Tuple[int, Callable[[], List[MarketDataPoint]]]]:
+    """
+    Lazily yield (n, loader for the first n ticks) for each n in sizes.
+    Each loader re-streams the CSV when called, so only the slice currently
+    being benchmarked is in memory, and pool workers load their own slice
+    instead of receiving it pickled.
+    """
     for n in sizes:
-        out.append((n, ticks[: min(n, len(ticks))]))
-    return out
+        yield n, partial(load_slice, csv_path, n)
 
 
 def main() -> None:
     csv_path = "btc_eth_market_data.csv"
-    ticks = load_market_data(csv_path)
 
     sizes = [1_000, 10_000, 100_000]
-    slices = make_slices(ticks, sizes)
+    slices = iter_slices(csv_path, sizes)
 
     from strategies import NaiveMovingAverageStrategy, WindowedMovingAverageStrategy, OptimizedMovingAverageStrategy
     from profiler import profile_runtime_memory
-    from reporting import plot_runtime, plot_memory, write_report
+    from reporting import group_results, plot_runtime, plot_memory, write_report
 
-    strategy_factories = [
-        ("naive", lambda: NaiveMovingAverageStrategy()),
-        ("windowed_k10", lambda: WindowedMovingAverageStrategy(window_size=10)),
-        ("optimized_k10", lambda: OptimizedMovingAverageStrategy(window_size=10)),
+    # Picklable factories (no lambdas), so the same list also works with max_workers > 1.
+    strategy_factories: List[Tuple[str, Callable[[], Strategy]]] = [
+        ("naive", NaiveMovingAverageStrategy),
+        ("windowed_k10", partial(WindowedMovingAverageStrategy, window_size=10)),
+        ("optimized_k10", partial(OptimizedMovingAverageStrategy, window_size=10)),
     ]
 
     # results is created HERE
@@ -49,6 +78,7 @@ def main() -> None:
         runner=run_strategy,
         do_cprofile=True,
         do_memory=True,
+        max_workers=1,  # sequential: concurrent cells would skew each other's timings
     )
 
     # results is used ONLY AFTER it exists
@@ -57,9 +87,10 @@ def main() -> None:
     memory_png = "artifacts/memory.png"
     report_md = "complexity_report.md"
 
-    plot_runtime(results, runtime_png)
-    plot_memory(results, memory_png)
-    write_report(results, report_md, runtime_png, memory_png)
+    grouped = group_results(results)
+    plot_runtime(grouped, runtime_png)
+    plot_memory(grouped, memory_png)
+    write_report(grouped, report_md, runtime_png, memory_png)
 
     for row in results:
         print(row)
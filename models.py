@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Union, overload
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
     """
     Immutable market tick.
 
+    Slotted: fields live in fixed slots rather than per-instance attribute
+    storage, which makes each tick smaller and cheaper to build while
+    keeping attribute reads as fast as before.
+
     Space complexity:
     - One object stores O(1) fields.
     - Storing n ticks in a list requires O(n) space (plus Python object overhead).
@@ -20,16 +27,78 @@ class MarketDataPoint:
     price: float
 
 
-@dataclass(frozen=True)
-class Signal:
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, eq=False)
+class TickBuffer:
+    """
+    Struct-of-arrays tick storage: one flat NumPy array per field.
+
+    - ts:    int64 nanoseconds since the Unix epoch (naive timestamps are taken as UTC)
+    - sym:   int32 index into `symbol_table`
+    - price: float64
+
+    Space complexity:
+    - O(n), at ~20 bytes per tick instead of a full Python object per tick.
+
+    Slicing returns another TickBuffer sharing the same arrays (no copy);
+    iterating yields MarketDataPoint views for per-tick strategies.
+    """
+    ts: np.ndarray
+    sym: np.ndarray
+    price: np.ndarray
+    symbol_table: List[str]
+
+    @staticmethod
+    def encode_timestamp(dt: datetime) -> int:
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return (dt - _EPOCH) // _ONE_US * 1000
+
+    @staticmethod
+    def decode_timestamp(ns: int) -> datetime:
+        return _EPOCH + timedelta(microseconds=ns // 1000)
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @overload
+    def __getitem__(self, key: int) -> MarketDataPoint: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> TickBuffer: ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[MarketDataPoint, TickBuffer]:
+        if isinstance(key, slice):
+            return TickBuffer(ts=self.ts[key], sym=self.sym[key], price=self.price[key], symbol_table=self.symbol_table)
+        return MarketDataPoint(
+            timestamp=self.decode_timestamp(int(self.ts[key])),
+            symbol=self.symbol_table[int(self.sym[key])],
+            price=float(self.price[key]),
+        )
+
+    def __iter__(self) -> Iterator[MarketDataPoint]:
+        decode = self.decode_timestamp
+        table = self.symbol_table
+        for ns, sid, price in zip(self.ts.tolist(), self.sym.tolist(), self.price.tolist()):
+            yield MarketDataPoint(timestamp=decode(ns), symbol=table[sid], price=price)
+
+
+class Signal(NamedTuple):
     """
     Minimal signal emitted by a strategy.
+
+    A NamedTuple rather than a frozen dataclass: construction is a plain
+    tuple build, with no per-field __setattr__ or meta dict.
     """
     timestamp: datetime
     symbol: str
     side: str  # "BUY" or "SELL"
     price: float
-    meta: Optional[Dict[str, Any]] = None
+    avg: float  # moving average the price was compared against
+    window: Optional[int] = None  # window size, for windowed strategies
 
 
 class Strategy(ABC):
@@ -38,4 +107,13 @@ class Strategy(ABC):
     """
     @abstractmethod
     def generate_signals(self, tick: MarketDataPoint) -> List[Signal]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def count_signals(self, tick: MarketDataPoint) -> int:
+        """
+        Process one tick and return how many signals it emits.
+
+        Used where only the count matters; subclasses override it to skip
+        building Signal objects.
+        """
+        return len(self.generate_signals(tick))
\ No newline at end of file
@@ -2,15 +2,23 @@ from __future__ import annotations
 
 import cProfile
 import io
+import os
 import pstats
 import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any, Union
 
 from models import MarketDataPoint, Strategy
 
 
 Runner = Callable[[Strategy, Iterable[MarketDataPoint]], int]
+# A slice is either the ticks themselves or a picklable zero-argument loader.
+TickSource = Union[List[MarketDataPoint], Callable[[], List[MarketDataPoint]]]
+
+# Upper bound on the profiler text stored per row.
+_MAX_PROFILE_CHARS = 8 * 1024
 
 
 @dataclass(frozen=True)
@@ -38,75 +46,176 @@ def _run_with_cprofile(runner: Runner, strategy: Strategy, ticks: List[MarketDat
     pr.disable()
     end = time.perf_counter()
 
+    if top_k <= 0:
+        return (end - start), signals, ""
+
     s = io.StringIO()
     stats = pstats.Stats(pr, stream=s).strip_dirs().sort_stats("tottime")
     stats.print_stats(top_k)
-    return (end - start), signals, s.getvalue()
+    return (end - start), signals, s.getvalue()[:_MAX_PROFILE_CHARS]
 
 
-def _run_with_memory(runner: Runner, strategy: Strategy, ticks: List[MarketDataPoint]) -> Tuple[float, int, Optional[float]]:
+def _run_with_sampler(
+    runner: Runner, strategy: Strategy, ticks: List[MarketDataPoint], top_k: int = 15, interval: float = 0.001
+) -> Tuple[float, int, Optional[str]]:
     """
-    Uses memory_profiler if available.
-    Returns peak memory in MiB (approx), else None.
+    Uses pyinstrument's statistical sampler if available: the stack is
+    sampled every `interval` seconds instead of hooking every call, so
+    overhead stays low even at large N. Returns the top_k frames by self
+    time as text, else None.
     """
     try:
-        from memory_profiler import memory_usage  # type: ignore
+        from pyinstrument import Profiler  # type: ignore
     except Exception:
-        # memory_profiler is optional; keep the pipeline running without it.
+        # pyinstrument is optional; keep the pipeline running without it.
         seconds, signals = _run_with_timer(runner, strategy, ticks)
         return seconds, signals, None
 
-    # memory_usage can call a function and sample process memory.
-    def _task() -> int:
-        return runner(strategy, ticks)
-
+    profiler = Profiler(interval=interval)
     start = time.perf_counter()
-    mem_series = memory_usage((_task, ()), interval=0.05, timeout=None, max_usage=False, retval=False)
+    profiler.start()
+    signals = runner(strategy, ticks)
+    profiler.stop()
     end = time.perf_counter()
 
-    # Peak in MiB.
-    peak = max(mem_series) if mem_series else None
-    # Re-run once to get signals deterministically (cheap relative to profiling).
-    signals = runner(strategy, ticks)
+    if top_k <= 0:
+        return (end - start), signals, ""
+
+    # Flat output: header block, blank line, then one frame per line.
+    lines = profiler.output_text(unicode=False, color=False, flat=True).rstrip().splitlines()
+    if "" in lines:
+        first_frame = len(lines) - lines[::-1].index("")
+        lines = lines[: first_frame + top_k]
+    return (end - start), signals, "\n".join(lines)[:_MAX_PROFILE_CHARS]
+
+
+def _run_with_memory(runner: Runner, strategy: Strategy, ticks: List[MarketDataPoint]) -> Tuple[float, int, Optional[float]]:
+    """
+    Uses tracemalloc to record the peak Python heap allocated while the
+    strategy runs, relative to the heap at start (already-loaded ticks are
+    not counted). Returns peak memory in MiB.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    try:
+        start = time.perf_counter()
+        signals = runner(strategy, ticks)
+        end = time.perf_counter()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return (end - start), signals, (peak - baseline) / 2**20
+
+
+def _run_one(
+    name: str,
+    n: int,
+    factory: Callable[[], Strategy],
+    tick_slice: TickSource,
+    runner: Runner,
+    do_cprofile: Union[bool, str],
+    do_memory: bool,
+    top_k: int,
+) -> ProfileRow:
+    """Profile one (strategy, size) cell. Module-level so worker processes can unpickle it."""
+    if callable(tick_slice):
+        tick_slice = tick_slice()  # loaded here, outside every measurement
+    strat_fresh = factory()
+
+    if do_cprofile:
+        if do_cprofile == "sample":
+            seconds, signals, top = _run_with_sampler(runner, strat_fresh, tick_slice, top_k=top_k)
+        else:
+            seconds, signals, top = _run_with_cprofile(runner, strat_fresh, tick_slice, top_k=top_k)
+        row = ProfileRow(strategy=name, n_ticks=n, seconds=seconds, signals=signals, cprofile_top=top)
+    else:
+        seconds, signals = _run_with_timer(runner, strat_fresh, tick_slice)
+        row = ProfileRow(strategy=name, n_ticks=n, seconds=seconds, signals=signals)
+
+    if do_memory:
+        strat_mem = factory()
+        _, _, peak = _run_with_memory(runner, strat_mem, tick_slice)
+        row = ProfileRow(
+            strategy=row.strategy,
+            n_ticks=row.n_ticks,
+            seconds=row.seconds,
+            signals=row.signals,
+            peak_mib=peak,
+            cprofile_top=row.cprofile_top,
+        )
+
+    return row
 
-    return (end - start), signals, peak
 
 def profile_runtime_memory(
     strategy_factories: List[Tuple[str, Callable[[], Strategy]]],
-    slices: List[Tuple[int, List[MarketDataPoint]]],
+    slices: Iterable[Tuple[int, TickSource]],
     runner: Runner,
-    do_cprofile: bool = True,
+    do_cprofile: Union[bool, str] = True,
     do_memory: bool = True,
+    top_k: int = 15,
+    max_workers: Optional[int] = 1,
 ) -> List[Dict[str, Any]]:
     """
     Profile runtime and memory for each strategy at each input size.
     Returns list of dict rows (easy to dump to Markdown/CSV later).
+
+    do_cprofile:
+    - True / "full": deterministic cProfile over the whole run
+    - "sample":      low-overhead sampling with pyinstrument
+    - False:         wall-clock timing only
+
+    top_k limits the hotspot listing kept per row (0 = profile but keep no
+    text); rows without profiler text carry no `cprofile_top` key.
+
+    max_workers: 1 runs every cell in this process; anything else (None =
+    one per CPU) runs the independent cells in a process pool. Factories,
+    runner and ticks must then be picklable, so use classes or
+    functools.partial rather than lambdas. Rows keep the input order.
+    Concurrent cells compete for cores, caches and turbo headroom, so
+    pooled timings depend on the machine; keep 1 for comparable seconds.
+
+    `slices` may be a lazy iterator: in-process runs consume one slice at a
+    time, so only the slice being profiled needs to be held; the process
+    pool materializes all of them up front.
+
+    A slice may also be given as a zero-argument loader. In-process runs
+    call it once per size; pool workers call it themselves, which avoids
+    pickling every tick once per job.
     """
-    rows: List[ProfileRow] = []
-
-    for n, tick_slice in slices:
-        for name, factory in strategy_factories:
-            strat_fresh = factory()
-
-            if do_cprofile:
-                seconds, signals, top = _run_with_cprofile(runner, strat_fresh, tick_slice)
-                row = ProfileRow(strategy=name, n_ticks=n, seconds=seconds, signals=signals, cprofile_top=top)
-            else:
-                seconds, signals = _run_with_timer(runner, strat_fresh, tick_slice)
-                row = ProfileRow(strategy=name, n_ticks=n, seconds=seconds, signals=signals)
-
-            if do_memory:
-                strat_mem = factory()
-                _, _, peak = _run_with_memory(runner, strat_mem, tick_slice)
-                row = ProfileRow(
-                    strategy=row.strategy,
-                    n_ticks=row.n_ticks,
-                    seconds=row.seconds,
-                    signals=row.signals,
-                    peak_mib=peak,
-                    cprofile_top=row.cprofile_top,
-                )
-
-            rows.append(row)
-
-    return [asdict(r) for r in rows]
\ No newline at end of file
+    if do_cprofile is True:
+        do_cprofile = "full"
+    if do_cprofile not in ("full", "sample", False):
+        raise ValueError(f"do_cprofile must be True, False, 'full' or 'sample'; got {do_cprofile!r}")
+
+    workers = max_workers or os.cpu_count() or 1
+
+    def jobs(load_here: bool) -> Iterator[tuple]:
+        for n, tick_slice in slices:
+            if load_here and callable(tick_slice):
+                tick_slice = tick_slice()  # share one load across strategies
+            for name, factory in strategy_factories:
+                yield (name, n, factory, tick_slice, runner, do_cprofile, do_memory, top_k)
+
+    rows: List[ProfileRow]
+    if workers <= 1:
+        rows = [_run_one(*job) for job in jobs(load_here=True)]
+    else:
+        job_list = list(jobs(load_here=False))
+        with ProcessPoolExecutor(max_workers=max(1, min(len(job_list), workers))) as pool:
+            futures = [pool.submit(_run_one, *job) for job in job_list]
+            rows = [f.result() for f in futures]
+
+    out: List[Dict[str, Any]] = []
+    for r in rows:
+        d = asdict(r)
+        if not d["cprofile_top"]:
+            del d["cprofile_top"]
+        out.append(d)
+    return out
\ No newline at end of file
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 
 def _fmt_float(x: Any, ndigits: int = 6) -> str:
@@ -24,61 +27,83 @@ def _fmt_float_2(x: Any) -> str:
         return "NA"
 
 
-def plot_runtime(results: List[Dict[str, Any]], out_path: str = "artifacts/runtime.png") -> None:
-    """Plot runtime vs input size for all strategies present in results."""
+def _mib_to_kib(x: Any) -> Optional[float]:
+    # O(k) strategies peak at a few KiB, which prints as 0.00 in MiB.
+    return None if x is None else float(x) * 1024
+
+
+def group_results(results: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group result rows by strategy, once, for all plots and the report.
+    Strategies come out in name order, each strategy's rows by n_ticks.
+    """
     by_strategy: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for r in results:
         by_strategy[str(r.get("strategy", "NA"))].append(r)
 
-    plt.figure()
-    for name, rows in sorted(by_strategy.items(), key=lambda x: x[0]):
-        rows_sorted = sorted(rows, key=lambda rr: int(rr.get("n_ticks", 0)))
+    by_n = itemgetter("n_ticks")
+    return {name: sorted(by_strategy[name], key=by_n) for name in sorted(by_strategy)}
+
+
+def _draw_runtime(ax: Axes, grouped: Dict[str, List[Dict[str, Any]]]) -> None:
+    for name, rows_sorted in grouped.items():
         xs = [int(rr.get("n_ticks", 0)) for rr in rows_sorted]
         ys = [float(rr.get("seconds", 0.0)) for rr in rows_sorted]
-        plt.plot(xs, ys, marker="o", label=name)
+        ax.plot(xs, ys, marker="o", label=name)
 
-    plt.xlabel("N ticks")
-    plt.ylabel("Runtime (s)")
-    plt.title("Runtime vs Input Size")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
+    ax.set_xlabel("N ticks")
+    ax.set_ylabel("Runtime (s)")
+    ax.set_title("Runtime vs Input Size")
+    ax.legend()
 
 
-def plot_memory(results: List[Dict[str, Any]], out_path: str = "artifacts/memory.png") -> None:
-    """Plot peak process memory vs input size for all strategies present in results."""
-    by_strategy: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for r in results:
-        by_strategy[str(r.get("strategy", "NA"))].append(r)
-
-    plt.figure()
-    for name, rows in sorted(by_strategy.items(), key=lambda x: x[0]):
-        rows_sorted = sorted(rows, key=lambda rr: int(rr.get("n_ticks", 0)))
+def _draw_memory(ax: Axes, grouped: Dict[str, List[Dict[str, Any]]]) -> None:
+    for name, rows_sorted in grouped.items():
         xs = [int(rr.get("n_ticks", 0)) for rr in rows_sorted]
         ys: List[float] = []
         for rr in rows_sorted:
-            peak = rr.get("peak_mib", None)
-            ys.append(float(peak) if peak is not None else float("nan"))
-        plt.plot(xs, ys, marker="o", label=name)
+            peak = _mib_to_kib(rr.get("peak_mib", None))
+            ys.append(peak if peak is not None else float("nan"))
+        ax.plot(xs, ys, marker="o", label=name)
+
+    ax.set_xlabel("N ticks")
+    ax.set_ylabel("Peak Memory (KiB, log scale)")
+    ax.set_yscale("log")  # O(N) history and O(k) windows differ by orders of magnitude
+    ax.set_title("Peak Memory vs Input Size (tracemalloc)")
+    ax.legend()
+
+
+def _new_figure(**kwargs: Any) -> Figure:
+    # Object-oriented API on an Agg canvas: no pyplot state machine or GUI backend.
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def plot_runtime(grouped: Dict[str, List[Dict[str, Any]]], out_path: str = "artifacts/runtime.png") -> None:
+    """Plot runtime vs input size for all strategies in `group_results` output."""
+    fig = _new_figure()
+    _draw_runtime(fig.add_subplot(), grouped)
+    fig.tight_layout()
+    fig.savefig(out_path)
+
 
-    plt.xlabel("N ticks")
-    plt.ylabel("Peak Memory (MiB)")
-    plt.title("Peak Memory vs Input Size (Process-Level)")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
+def plot_memory(grouped: Dict[str, List[Dict[str, Any]]], out_path: str = "artifacts/memory.png") -> None:
+    """Plot peak traced memory vs input size for all strategies in `group_results` output."""
+    fig = _new_figure()
+    _draw_memory(fig.add_subplot(), grouped)
+    fig.tight_layout()
+    fig.savefig(out_path)
 
 
 def write_report(
-    results: List[Dict[str, Any]],
+    grouped: Dict[str, List[Dict[str, Any]]],
     out_path: str = "complexity_report.md",
     runtime_png: str = "artifacts/runtime.png",
     memory_png: str = "artifacts/memory.png",
 ) -> None:
-    """Write a markdown report from profiling results."""
-    results_sorted = sorted(results, key=lambda r: (str(r.get("strategy")), int(r.get("n_ticks", 0))))
+    """Write a markdown report from `group_results` output."""
+    results_sorted = [r for rows in grouped.values() for r in rows]
 
     lines: List[str] = []
     lines.append("# Complexity Report\n")
@@ -116,13 +141,13 @@ def write_report(
         lines.append("- Runtime results match the Big-O expectations across input sizes.\n")
 
     lines.append("- Naive runtime is dominated by repeated `sum(...)` over growing history (confirmed by `cProfile`).\n")
-    lines.append("- Windowed/optimized runtime is dominated by constant-time deque updates and arithmetic.\n")
+    lines.append("- Windowed/optimized runtime is dominated by constant-time window updates (deque for windowed, ring buffer for optimized) and arithmetic.\n")
     lines.append(
         "- The optimized moving average implementation matches windowed asymptotics (**O(1)** per tick, **O(k)** space) by using incremental updates and bounded buffers.\n"
     )
 
     lines.append("\n## Benchmark Results\n")
-    lines.append("| Strategy | N ticks | Runtime (s) | Runtime / tick (µs) | Peak Memory (MiB) | Signals |\n")
+    lines.append("| Strategy | N ticks | Runtime (s) | Runtime / tick (µs) | Peak Memory (KiB) | Signals |\n")
     lines.append("|---|---:|---:|---:|---:|---:|\n")
 
     for r in results_sorted:
@@ -137,7 +162,7 @@ def write_report(
             per_tick_us = float(seconds) / n_ticks * 1e6
 
         lines.append(
-            f"| {strategy} | {n_ticks} | {_fmt_float(seconds, 6)} | {_fmt_float_2(per_tick_us)} | {_fmt_float_2(peak_mib)} | {signals} |\n"
+            f"| {strategy} | {n_ticks} | {_fmt_float(seconds, 6)} | {_fmt_float_2(per_tick_us)} | {_fmt_float_2(_mib_to_kib(peak_mib))} | {signals} |\n"
         )
 
     lines.append("\n## Scaling Plots\n")
@@ -148,15 +173,15 @@ def write_report(
 
     lines.append("\n## Measurement Notes (Memory)\n")
     lines.append(
-        "- Peak memory is measured at the **process level** (Python runtime + loaded data + imported libraries), not just the strategy object.\n"
+        "- Peak memory is the peak Python heap allocated **during** each run, measured with `tracemalloc` relative to the heap at start; loaded tick data, the interpreter and imported libraries are excluded.\n"
     )
     lines.append(
-        "- Therefore, absolute peak memory values may look similar across strategies even though their asymptotic space complexity differs (**O(N)** vs **O(k)**).\n"
+        "- Because only the run's own allocations are counted, the values reflect each strategy's space complexity (**O(N)** history vs **O(k)** window).\n"
     )
 
     lines.append("\n## Profiling Notes (cProfile)\n")
     lines.append("- Naive hotspots are dominated by `builtins.sum`, consistent with recomputing full-history averages.\n")
-    lines.append("- Windowed/optimized hotspots are concentrated in constant-time deque operations and arithmetic updates.\n")
+    lines.append("- Windowed/optimized hotspots are concentrated in constant-time window updates (deque for windowed, ring buffer for optimized) and arithmetic.\n")
 
     with open(out_path, "w", encoding="utf-8") as f:
         f.writelines(lines)
\ No newline at end of file
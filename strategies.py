@@ -1,21 +1,39 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from models import MarketDataPoint, Signal, Strategy
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _check_symbol_ids(sym: np.ndarray, n_symbols: Optional[int]) -> int:
+    """Resolve the symbol count for a batch call and bounds-check `sym`."""
+    if len(sym) == 0:
+        return 0 if n_symbols is None else n_symbols
+    lo, hi = int(sym.min()), int(sym.max())
+    if n_symbols is None:
+        n_symbols = hi + 1
+    if lo < 0 or hi >= n_symbols:
+        raise ValueError(f"symbol ids must lie in [0, {n_symbols}); got [{lo}, {hi}]")
+    return n_symbols
+
 
 class NaiveMovingAverageStrategy(Strategy):
     def __init__(self) -> None:
         self._price_history: Dict[str, List[float]] = {}
 
-    def generate_signals(self, tick: MarketDataPoint) -> List[Signal]:
+    def _update_average(self, tick: MarketDataPoint) -> float:
         prices = self._price_history.setdefault(tick.symbol, [])
         prices.append(tick.price)  # O(1) amortized
 
         # Recompute average from scratch: O(n)
-        avg_price = sum(prices) / len(prices)
+        return sum(prices) / len(prices)
+
+    def generate_signals(self, tick: MarketDataPoint) -> List[Signal]:
+        avg_price = self._update_average(tick)
 
         if tick.price > avg_price:
             side = "BUY"
@@ -30,12 +48,21 @@ class NaiveMovingAverageStrategy(Strategy):
                 symbol=tick.symbol,
                 side=side,
                 price=tick.price,
-                meta={"average": avg_price},
+                avg=avg_price,
             )
         ]
 
+    def count_signals(self, tick: MarketDataPoint) -> int:
+        avg_price = self._update_average(tick)
+        price = tick.price
+        return 1 if price > avg_price or price < avg_price else 0
+
 
 class WindowedMovingAverageStrategy(Strategy):
+    # The cumsum batch path can resolve near-ties differently from the running
+    # sum, so run_strategy only dispatches to it when a subclass sets this.
+    exact_batch = False
+
     def __init__(self, window_size: int = 10) -> None:
         if window_size <= 0:
             raise ValueError("window_size must be positive")
@@ -44,7 +71,7 @@ class WindowedMovingAverageStrategy(Strategy):
         self._buffers: Dict[str, deque[float]] = {}
         self._running_sum: Dict[str, float] = {}
 
-    def generate_signals(self, tick: MarketDataPoint) -> List[Signal]:
+    def _update_average(self, tick: MarketDataPoint) -> float:
         buffer = self._buffers.setdefault(tick.symbol, deque())
         current_sum = self._running_sum.get(tick.symbol, 0.0)
 
@@ -57,7 +84,10 @@ class WindowedMovingAverageStrategy(Strategy):
 
         self._running_sum[tick.symbol] = current_sum
 
-        avg_price = current_sum / len(buffer)  # O(1)
+        return current_sum / len(buffer)  # O(1)
+
+    def generate_signals(self, tick: MarketDataPoint) -> List[Signal]:
+        avg_price = self._update_average(tick)
 
         if tick.price > avg_price:
             side = "BUY"
@@ -72,41 +102,115 @@ class WindowedMovingAverageStrategy(Strategy):
                 symbol=tick.symbol,
                 side=side,
                 price=tick.price,
-                meta={"average": avg_price, "window": self.window_size},
+                avg=avg_price,
+                window=self.window_size,
             )
         ]
 
+    def count_signals(self, tick: MarketDataPoint) -> int:
+        avg_price = self._update_average(tick)
+        price = tick.price
+        return 1 if price > avg_price or price < avg_price else 0
+
+    def generate_signals_batch(
+        self, prices: np.ndarray, sym: Optional[np.ndarray] = None, n_symbols: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Vectorized equivalent of feeding `prices` through a fresh strategy
+        tick by tick. Does not touch the per-tick state.
+
+        `sym` holds each tick's symbol id in [0, n_symbols) (e.g. TickBuffer.sym);
+        when omitted, all prices belong to one symbol. `n_symbols` defaults
+        to max(sym) + 1; ids outside [0, n_symbols) raise ValueError.
+
+        Returns an int8 array of sides: 1 = BUY, -1 = SELL, 0 = no signal.
+        Ties (price == average) are subject to float rounding, so they can
+        resolve differently from the running-sum path on real-valued data.
+
+        Time:  O(N) in a handful of NumPy passes per symbol (cumsum-based rolling mean)
+        Space: O(N) temporaries
+        """
+        import numpy as np
+
+        prices = np.asarray(prices, dtype=np.float64)
+        if sym is None:
+            return self._sides_one_symbol(prices)
+
+        sym = np.asarray(sym)
+        n_symbols = _check_symbol_ids(sym, n_symbols)
+        out = np.zeros(len(prices), dtype=np.int8)
+        for sid in range(n_symbols):
+            mask = sym == sid
+            out[mask] = self._sides_one_symbol(prices[mask])
+        return out
+
+    def _sides_one_symbol(self, prices: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        k = self.window_size
+        n = len(prices)
+
+        csum = np.cumsum(prices)
+        avg = np.empty(n, dtype=np.float64)
+        head = min(k, n)
+        avg[:head] = csum[:head] / np.arange(1, head + 1)  # ramp-up: window not yet full
+        if n > k:
+            avg[k:] = (csum[k:] - csum[:-k]) / k
+
+        return (prices > avg).astype(np.int8) - (prices < avg).astype(np.int8)
+
 
 class OptimizedMovingAverageStrategy(Strategy):
     """
     Fixed-window moving average with O(1) per-tick update.
     Space is O(k) per symbol (k = window_size).
+
+    Each symbol's window is a fixed-size list used as a ring buffer, so the
+    steady state overwrites one slot per tick instead of allocating.
     """
 
     def __init__(self, window_size: int = 10):
+        if window_size <= 0:
+            raise ValueError("window_size must be positive")
+
         self._window_size = window_size
-        self._buffers = {}       # symbol -> deque[float]
-        self._running_sums = {}  # symbol -> float
-        self._last_signal = {}   # symbol -> str
+        self._buffers: Dict[str, List[float]] = {}  # ring buffer of up to k prices
+        self._state: Dict[str, list] = {}  # [running sum, ring write index, last signal]
 
-    def generate_signals(self, tick: MarketDataPoint) -> list:
+    def _update_signal(self, tick: MarketDataPoint) -> Optional[str]:
+        """Advance the window; return the new side if it changed, else None."""
         sym = tick.symbol
-        buf = self._buffers.setdefault(sym, deque())
-        s = self._running_sums.get(sym, 0.0)
-
-        buf.append(tick.price)
-        s += tick.price
+        price = tick.price
+        buf = self._buffers.get(sym)
+        if buf is None:
+            buf = self._buffers[sym] = []
+            state = self._state[sym] = [0.0, 0, None]
+        else:
+            state = self._state[sym]
 
-        if len(buf) > self._window_size:
-            s -= buf.popleft()
+        s = state[0] + price
+        if len(buf) < self._window_size:
+            buf.append(price)
+        else:
+            idx = state[1]
+            s -= buf[idx]
+            buf[idx] = price
+            idx += 1
+            state[1] = 0 if idx == self._window_size else idx
+        state[0] = s
 
-        self._running_sums[sym] = s
         avg = s / len(buf)
 
-        signal = "BUY" if tick.price > avg else "SELL"
-        last = self._last_signal.get(sym)
+        signal = "BUY" if price > avg else "SELL"
+
+        if signal != state[2]:
+            state[2] = signal
+            return signal
+        return None
+
+    def generate_signals(self, tick: MarketDataPoint) -> list:
+        signal = self._update_signal(tick)
+        return [] if signal is None else [signal]
 
-        if signal != last:
-            self._last_signal[sym] = signal
-            return [signal]
-        return []
\ No newline at end of file
+    def count_signals(self, tick: MarketDataPoint) -> int:
+        return 0 if self._update_signal(tick) is None else 1
\ No newline at end of file
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from numba import njit
+
+from strategies import OptimizedMovingAverageStrategy, WindowedMovingAverageStrategy, _check_symbol_ids
+
+
+@njit(cache=True)
+def windowed_sides(prices: np.ndarray, sym: np.ndarray, n_symbols: int, k: int) -> np.ndarray:
+    """
+    Compiled WindowedMovingAverageStrategy over interleaved ticks.
+    Per-symbol state lives in flat arrays indexed by symbol id (ring buffer
+    row, write index, fill count, running sum), updated in the same order
+    as the deque version.
+
+    Returns int8 sides: 1 = BUY, -1 = SELL, 0 = no signal.
+    """
+    n = prices.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    ring = np.zeros((n_symbols, k), dtype=np.float64)
+    sums = np.zeros(n_symbols, dtype=np.float64)
+    idx = np.zeros(n_symbols, dtype=np.int32)
+    count = np.zeros(n_symbols, dtype=np.int32)
+
+    for i in range(n):
+        sid = sym[i]
+        p = prices[i]
+        s = sums[sid] + p
+        c = count[sid]
+        if c < k:
+            ring[sid, c] = p
+            c += 1
+            count[sid] = c
+        else:
+            j = idx[sid]
+            s -= ring[sid, j]
+            ring[sid, j] = p
+            j += 1
+            idx[sid] = 0 if j == k else j
+        sums[sid] = s
+
+        avg = s / c
+        if p > avg:
+            out[i] = 1
+        elif p < avg:
+            out[i] = -1
+
+    return out
+
+
+@njit(cache=True)
+def optimized_sides(prices: np.ndarray, sym: np.ndarray, n_symbols: int, k: int) -> np.ndarray:
+    """
+    Compiled OptimizedMovingAverageStrategy over interleaved ticks: a side
+    is emitted only when it differs from that symbol's previous one.
+
+    Returns int8 sides: 1 = BUY, -1 = SELL, 0 = no signal.
+    """
+    n = prices.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    ring = np.zeros((n_symbols, k), dtype=np.float64)
+    sums = np.zeros(n_symbols, dtype=np.float64)
+    idx = np.zeros(n_symbols, dtype=np.int32)
+    count = np.zeros(n_symbols, dtype=np.int32)
+    last = np.zeros(n_symbols, dtype=np.int8)
+
+    for i in range(n):
+        sid = sym[i]
+        p = prices[i]
+        s = sums[sid] + p
+        c = count[sid]
+        if c < k:
+            ring[sid, c] = p
+            c += 1
+            count[sid] = c
+        else:
+            j = idx[sid]
+            s -= ring[sid, j]
+            ring[sid, j] = p
+            j += 1
+            idx[sid] = 0 if j == k else j
+        sums[sid] = s
+
+        side = 1 if p > s / c else -1
+        if side != last[sid]:
+            out[i] = side
+            last[sid] = side
+
+    return out
+
+
+def _kernel_args(prices: np.ndarray, sym: Optional[np.ndarray], n_symbols: Optional[int]) -> tuple:
+    # The kernels index state arrays by symbol id unchecked, so validate here.
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    if sym is None:
+        return prices, np.zeros(prices.shape[0], dtype=np.int32), 1
+    sym = np.asarray(sym)
+    n_symbols = _check_symbol_ids(sym, n_symbols)  # before the int32 cast can wrap
+    return prices, np.ascontiguousarray(sym, dtype=np.int32), n_symbols
+
+
+class NumbaWindowedMovingAverageStrategy(WindowedMovingAverageStrategy):
+    """WindowedMovingAverageStrategy whose batch path runs a compiled kernel."""
+
+    exact_batch = True  # same update order as the per-tick path
+
+    def generate_signals_batch(
+        self, prices: np.ndarray, sym: Optional[np.ndarray] = None, n_symbols: Optional[int] = None
+    ) -> np.ndarray:
+        prices, sym, n_symbols = _kernel_args(prices, sym, n_symbols)
+        return windowed_sides(prices, sym, n_symbols, self.window_size)
+
+
+class NumbaOptimizedMovingAverageStrategy(OptimizedMovingAverageStrategy):
+    """OptimizedMovingAverageStrategy whose batch path runs a compiled kernel."""
+
+    exact_batch = True  # same update order as the per-tick path
+
+    def generate_signals_batch(
+        self, prices: np.ndarray, sym: Optional[np.ndarray] = None, n_symbols: Optional[int] = None
+    ) -> np.ndarray:
+        prices, sym, n_symbols = _kernel_args(prices, sym, n_symbols)
+        return optimized_sides(prices, sym, n_symbols, self._window_size)
\ No newline at end of file
@@ -1,7 +1,20 @@
+import importlib.util
+import os
+import tempfile
 import time
+import unittest
+from datetime import datetime
+from itertools import islice
 
-from data_loader import load_market_data
-from strategies import WindowedMovingAverageStrategy, OptimizedMovingAverageStrategy
+from data_loader import _parse_timestamp, iter_market_data, load_market_data, load_tick_buffer
+from main import make_slices, run_strategy
+from models import TickBuffer
+from strategies import NaiveMovingAverageStrategy, WindowedMovingAverageStrategy, OptimizedMovingAverageStrategy
+
+
+def _require(module: str) -> None:
+    if importlib.util.find_spec(module) is None:
+        raise unittest.SkipTest(f"{module} is not installed")
 
 
 def test_strategies_run_and_return_list():
@@ -44,23 +57,205 @@ def test_optimized_window_is_bounded():
         assert len(buf) <= k
 
 
+def test_count_signals_matches_generate_signals():
+    ticks = load_market_data("btc_eth_market_data.csv")[:5_000]
+
+    for factory in (
+        NaiveMovingAverageStrategy,
+        lambda: WindowedMovingAverageStrategy(window_size=10),
+        lambda: OptimizedMovingAverageStrategy(window_size=10),
+    ):
+        counting, emitting = factory(), factory()
+        for t in ticks:
+            assert counting.count_signals(t) == len(emitting.generate_signals(t))
+
+
+def test_parse_timestamp_formats():
+    assert _parse_timestamp("2015-07-20 21:00:00") == datetime(2015, 7, 20, 21, 0, 0)
+    assert _parse_timestamp(" 2015-07-20T21:05:09 ") == datetime(2015, 7, 20, 21, 5, 9)
+    assert _parse_timestamp("2015-7-20 21:00:00") == datetime(2015, 7, 20, 21, 0, 0)
+    assert _parse_timestamp("2015-07-20 1:00:00") == datetime(2015, 7, 20, 1, 0, 0)
+
+    for bad in ("2015-13-20 21:00:00", "2015- 7-20 21:00:00", "2015-07-20 21:00:+0"):
+        try:
+            _parse_timestamp(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{bad!r} should be rejected")
+
+
+def test_iter_market_data_streams_same_ticks():
+    ticks = load_market_data("btc_eth_market_data.csv")
+    assert list(islice(iter_market_data("btc_eth_market_data.csv"), 1000)) == ticks[:1000]
+    assert list(iter_market_data("btc_eth_market_data.csv", symbol_filter="ETH")) == [t for t in ticks if t.symbol == "ETH"]
+    assert make_slices("btc_eth_market_data.csv", [10, 1000]) == [(10, ticks[:10]), (1000, ticks[:1000])]
+
+
+# Layouts the python parser accepts and the columnar backends must match:
+# reordered columns, padding whitespace, unpadded fields, fractional seconds,
+# the ISO 'T' separator and a blank line.
+_EDGE_CASE_CSV = """symbol,price,timestamp
+BTC,1.5,2015-07-20 21:00:00
+ ETH ,2, 2015-7-20 1:00:00
+BTC,3.25,2015-07-20 21:00:00.5
+ETH,4,2015-07-20T22:00:00
+ETH,5,2015-07-20T22:00:00.123456
+
+BTC,6,2016-02-29 23:59:59
+"""
+
+
+def _assert_backend_matches_python(backend: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        edge_path = os.path.join(tmp, "edge.csv")
+        with open(edge_path, "w", encoding="utf-8") as f:
+            f.write(_EDGE_CASE_CSV)
+        offset_path = os.path.join(tmp, "offset.csv")
+        with open(offset_path, "w", encoding="utf-8") as f:
+            f.write("timestamp,symbol,price\n2015-07-20 21:00:00,BTC,1\n2015-07-20T22:00:00+01:00,BTC,2\n")
+
+        for path in ("btc_eth_market_data.csv", edge_path):
+            for symbol_filter in (None, "ETH"):
+                expected = load_market_data(path, symbol_filter=symbol_filter)
+                got = load_market_data(path, symbol_filter=symbol_filter, backend=backend)
+                assert got == expected, (backend, path, symbol_filter)
+
+                if importlib.util.find_spec("numpy") is not None:
+                    expected_buf = load_tick_buffer(path, symbol_filter=symbol_filter)
+                    got_buf = load_tick_buffer(path, symbol_filter=symbol_filter, backend=backend)
+                    assert got_buf.symbol_table == expected_buf.symbol_table, (backend, path, symbol_filter)
+                    for field in ("ts", "sym", "price"):
+                        assert getattr(got_buf, field).dtype == getattr(expected_buf, field).dtype, (backend, field)
+                        assert (getattr(got_buf, field) == getattr(expected_buf, field)).all(), (backend, field)
+
+        # UTC offsets are python-only: the columnar backends must refuse them, not return strings.
+        try:
+            load_market_data(offset_path, backend=backend)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"backend={backend!r} accepted a UTC offset")
+
+
+def test_arrow_backend_matches_python_loader():
+    _require("pyarrow")
+    _assert_backend_matches_python("arrow")
+
+
+def test_polars_backend_matches_python_loader():
+    _require("polars")
+    _assert_backend_matches_python("polars")
+
+
+def test_tick_buffer_matches_list_loader():
+    _require("numpy")
+    ticks = load_market_data("btc_eth_market_data.csv")[:1000]
+    buf = load_tick_buffer("btc_eth_market_data.csv")[:1000]
+
+    assert len(buf) == len(ticks)
+    assert buf.symbol_table == ["BTC", "ETH"]
+    assert list(buf) == ticks
+    assert buf[-1] == ticks[-1]
+
+
+def test_windowed_batch_matches_per_tick():
+    _require("numpy")
+    import numpy as np
+
+    # Small integer prices keep every running sum exact, so ties agree too.
+    rng = np.random.default_rng(0)
+    n = 2_000
+    buf = TickBuffer(
+        ts=np.arange(n, dtype=np.int64) * 3_600_000_000_000,
+        sym=rng.integers(0, 2, size=n).astype(np.int32),
+        price=rng.integers(1, 6, size=n).astype(np.float64),
+        symbol_table=["BTC", "ETH"],
+    )
+
+    for k in (1, 3, 10):
+        sides = WindowedMovingAverageStrategy(window_size=k).generate_signals_batch(buf.price, buf.sym, 2)
+        per_tick = run_strategy(WindowedMovingAverageStrategy(window_size=k), list(buf))
+        assert int((sides != 0).sum()) == per_tick, (k, per_tick)
+
+    # On real prices the cumsum path may break ties differently, so
+    # run_strategy must keep the plain strategy on the per-tick path.
+    real = load_tick_buffer("btc_eth_market_data.csv")
+    assert run_strategy(WindowedMovingAverageStrategy(window_size=10), real) == run_strategy(
+        WindowedMovingAverageStrategy(window_size=10), list(real)
+    )
+
+
+def test_batch_infers_and_checks_symbol_count():
+    _require("numpy")
+    import numpy as np
+
+    strategies = [WindowedMovingAverageStrategy(window_size=3)]
+    if importlib.util.find_spec("numba") is not None:
+        from strategies_numba import NumbaOptimizedMovingAverageStrategy, NumbaWindowedMovingAverageStrategy
+
+        strategies += [NumbaWindowedMovingAverageStrategy(window_size=3), NumbaOptimizedMovingAverageStrategy(window_size=3)]
+
+    prices = np.array([1.0, 5.0, 2.0, 4.0, 3.0, 3.0, 6.0, 1.0])
+    sym = np.array([0, 2, 1, 2, 0, 1, 2, 0], dtype=np.int32)
+    for strat in strategies:
+        assert (strat.generate_signals_batch(prices, sym) == strat.generate_signals_batch(prices, sym, 3)).all()
+        for bad_sym, n_symbols in ((sym, 2), (sym - 1, None)):
+            try:
+                strat.generate_signals_batch(prices, bad_sym, n_symbols)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{type(strat).__name__} accepted out-of-range symbol ids")
+
+
+def test_numba_kernels_match_per_tick():
+    _require("numba")
+    from strategies_numba import NumbaOptimizedMovingAverageStrategy, NumbaWindowedMovingAverageStrategy
+
+    buf = load_tick_buffer("btc_eth_market_data.csv")[:10_000]
+    ticks = list(buf)
+
+    pairs = [
+        (NumbaWindowedMovingAverageStrategy, WindowedMovingAverageStrategy),
+        (NumbaOptimizedMovingAverageStrategy, OptimizedMovingAverageStrategy),
+    ]
+    for jitted, reference in pairs:
+        assert run_strategy(jitted(window_size=10), buf) == run_strategy(reference(window_size=10), ticks)
+
+
 def run_all_tests():
     tests = [
         ("test_strategies_run_and_return_list", test_strategies_run_and_return_list),
         ("test_optimized_under_one_second_for_100k", test_optimized_under_one_second_for_100k),
         ("test_optimized_window_is_bounded", test_optimized_window_is_bounded),
+        ("test_count_signals_matches_generate_signals", test_count_signals_matches_generate_signals),
+        ("test_parse_timestamp_formats", test_parse_timestamp_formats),
+        ("test_iter_market_data_streams_same_ticks", test_iter_market_data_streams_same_ticks),
+        ("test_arrow_backend_matches_python_loader", test_arrow_backend_matches_python_loader),
+        ("test_polars_backend_matches_python_loader", test_polars_backend_matches_python_loader),
+        ("test_tick_buffer_matches_list_loader", test_tick_buffer_matches_list_loader),
+        ("test_windowed_batch_matches_per_tick", test_windowed_batch_matches_per_tick),
+        ("test_batch_infers_and_checks_symbol_count", test_batch_infers_and_checks_symbol_count),
+        ("test_numba_kernels_match_per_tick", test_numba_kernels_match_per_tick),
     ]
 
     print("Running tests.py ...")
     passed = 0
+    skipped = 0
     for name, fn in tests:
         start = time.perf_counter()
-        fn()
+        try:
+            fn()
+        except unittest.SkipTest as exc:
+            print(f"[SKIP] {name} ({exc})")
+            skipped += 1
+            continue
         end = time.perf_counter()
         print(f"[PASS] {name} ({(end - start):.3f}s)")
         passed += 1
 
-    print(f"All tests passed: {passed}/{len(tests)}")
+    print(f"All tests passed: {passed}/{len(tests) - skipped} ({skipped} skipped)")
 
 
 if __name__ == "__main__":